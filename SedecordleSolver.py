@@ -1,44 +1,250 @@
 # Import required libraries (same as Wordle solver)
+import hashlib
 import math
+import os
 from collections import defaultdict
-from tqdm import tqdm  # For progress visualization
+import numpy as np  # Vectorized pattern/entropy math
+from numba import njit, prange  # JIT-compiled pattern matrix build
+
+# All kernels carry explicit signatures so they compile eagerly at import
+# and land in numba's on-disk cache: no per-session JIT warmup on the first
+# get_best_guess. (numba.pycc AOT compilation is deprecated and slated for
+# removal upstream; eager cached compilation is the supported alternative.)
+
+
+@njit('i8(u1[:], u1[:])', cache=True, fastmath=True)
+def _pattern_code(g, t):
+    # Two-pass Wordle scoring on two uint8[5] buffers, returning the
+    # base-3 pattern code (A=0, P=1, C=2 per position) in [0, 243)
+    counts = np.zeros(26, np.int8)
+    for k in range(5):
+        if g[k] != t[k]:
+            counts[t[k] - 65] += 1
+    code = 0
+    for k in range(5):
+        if g[k] == t[k]:
+            digit = 2
+        elif counts[g[k] - 65] > 0:
+            counts[g[k] - 65] -= 1
+            digit = 1
+        else:
+            digit = 0
+        code += digit * 3 ** k
+    return code
+
+
+@njit('i8(u1[:], u1[:], u8, u8, u4, u4)', cache=True, fastmath=True)
+def _pattern_code_swar(g, t, g64, t64, g_letters, t_letters):
+    # Same scoring as _pattern_code, but with the words packed into single
+    # uint64s: equal positions are found with one SWAR zero-byte detect on
+    # the XOR instead of five scalar compares, and letter-presence bitmasks
+    # let fully-disjoint pairs short-circuit to all-absent
+    x = g64 ^ t64
+    if x == np.uint64(0):
+        return 242  # Every position correct
+    if (g_letters & t_letters) == np.uint32(0):
+        return 0  # No shared letters: every position absent
+    # Bit 8k+7 of `lanes` is set iff byte lane k of g and t are equal; the
+    # 0x7F form is carry-free per byte, so there are no borrow false positives
+    m7f = np.uint64(0x7F7F7F7F7F7F7F7F)
+    lanes = ~(((x & m7f) + m7f) | x | m7f)
+    counts = np.zeros(26, np.int8)
+    for k in range(5):
+        if ((lanes >> np.uint64(8 * k + 7)) & np.uint64(1)) == np.uint64(0):
+            counts[t[k] - 65] += 1
+    code = 0
+    for k in range(5):
+        if (lanes >> np.uint64(8 * k + 7)) & np.uint64(1):
+            digit = 2
+        elif counts[g[k] - 65] > 0:
+            counts[g[k] - 65] -= 1
+            digit = 1
+        else:
+            digit = 0
+        code += digit * 3 ** k
+    return code
+
+
+@njit('void(u1[:], u1[:,:], u1[:])', parallel=True, cache=True)
+def _pattern_row(g, targets, out):
+    # Score one guess against every row of a (N, 5) uint8 target matrix
+    for j in prange(targets.shape[0]):
+        out[j] = _pattern_code(g, targets[j])
+
+
+@njit('void(u1[:,:], i4[:], i8[:], f4[:], f4[:], f4[:], f4, f4[:])',
+      parallel=True, cache=True)
+def _score_candidates(pattern_matrix, pools_flat, pool_offsets, pool_weights,
+                      remaining_ub, log2_table, best_so_far, out_scores):
+    # Combined entropy of every candidate across all games, parallel over
+    # candidates. Game g's pool is pools_flat[pool_offsets[g]:pool_offsets[g+1]]
+    # weighted by how many games share it, and remaining_ub[g] bounds the
+    # entropy still reachable from game g on (weighted sum of log2 pool
+    # sizes), so hopeless candidates stop early
+    n_games = pool_offsets.shape[0] - 1
+    for ci in prange(out_scores.shape[0]):
+        # One row per candidate, shared by every game in the inner loop, so
+        # it stays cache-hot instead of being re-read once per (game, word)
+        row = pattern_matrix[ci]
+        counts = np.zeros(243, np.int32)  # Thread-local pattern histogram
+        # float32 throughout: ranking 2316 candidates needs ~5 significant
+        # digits, and the narrower lanes double SIMD throughput
+        total_entropy = np.float32(0.0)
+        for g in range(n_games):
+            # Branch-and-bound: even a perfect split of the remaining
+            # games cannot beat the best score seen so far
+            if total_entropy + remaining_ub[g] < best_so_far:
+                break
+            start, end = pool_offsets[g], pool_offsets[g + 1]
+            pool_size = end - start
+            if pool_size == 0:
+                continue
+            for t in range(start, end):
+                counts[row[pools_flat[t]]] += 1
+            # Entropy via H = log2(T) - (1/T) * sum(k * log2(k)): every
+            # transcendental becomes a load from the shared log2 table
+            # (count 1 buckets contribute k*log2(k) = 0 and are skipped)
+            weighted_logs = np.float32(0.0)
+            if pool_size < 243:
+                # Small pool: read and reset only the touched bins in one
+                # fused pass (duplicates see 0 on revisits and are no-ops)
+                for t in range(start, end):
+                    c = row[pools_flat[t]]
+                    k = counts[c]
+                    if k > 1:
+                        weighted_logs += np.float32(k) * log2_table[k]
+                    counts[c] = 0
+            else:
+                for c in range(243):
+                    if counts[c] > 1:
+                        weighted_logs += np.float32(counts[c]) * log2_table[counts[c]]
+                    counts[c] = 0
+            total_entropy += pool_weights[g] * (
+                log2_table[pool_size] - weighted_logs / np.float32(pool_size))
+        out_scores[ci] = total_entropy
+
+
+@njit('u1[:,:](u1[:,:], u1[:,:], u8[:], u8[:], u4[:], u4[:])',
+      parallel=True, cache=True)
+def _build_pattern_matrix(guesses_arr, answers_arr, guesses_u64, answers_u64,
+                          guesses_letters, answers_letters):
+    # Fill matrix[i, j] with the base-3 pattern code for guess i vs answer j
+    matrix = np.empty((guesses_arr.shape[0], answers_arr.shape[0]), np.uint8)
+    for i in prange(guesses_arr.shape[0]):
+        for j in range(answers_arr.shape[0]):
+            matrix[i, j] = _pattern_code_swar(
+                guesses_arr[i], answers_arr[j], guesses_u64[i], answers_u64[j],
+                guesses_letters[i], answers_letters[j])
+    return matrix
+
+
+def _pack_u64(words_arr):
+    # Pack each (5,) uint8 row into one little-endian uint64 (top 3 bytes zero)
+    packed = np.zeros((words_arr.shape[0], 8), np.uint8)
+    packed[:, :5] = words_arr
+    return packed.view(np.uint64).ravel()
+
+
+def _letter_masks(words_arr):
+    # One uint32 per word with bit i set iff letter chr(65+i) appears in it
+    return np.bitwise_or.reduce(
+        np.uint32(1) << (words_arr.astype(np.uint32) - 65), axis=1)
+
+
+class Game:
+    # Per-game state; __slots__ keeps attribute access off the instance
+    # dict and the 16 instances compact
+    __slots__ = ('possible_idx', 'correct', 'present', 'absent',
+                 'present_mask', 'absent_mask')
+
+    def __init__(self, n_answers):
+        # Possible solutions: sorted row indices into answers_arr
+        self.possible_idx = np.arange(n_answers, dtype=np.int32)
+        self.correct = np.full(5, -1, np.int8)  # Known positions (0-25, -1 = unknown)
+        self.present = set()  # Present letters (wrong position)
+        self.absent = set()  # Excluded letters
+        self.present_mask = 0  # Same letters as 26-bit masks
+        self.absent_mask = 0
+
 
 class SedecordleSolver:
-    _pattern_cache = {}  # Class-level cache for pattern calculations
-    
     def __init__(self, answer_path, guess_path=None):
-        # Initialize with answer words and allowed guesses
-        self.answers = self.load_valid_words(answer_path)
-        self.allowed = self.load_valid_words(guess_path) if guess_path else self.answers.copy()
-        
+        # Initialize with answer words and allowed guesses; each list is
+        # loaded once as a (N, 5) uint8 matrix (the hot-path representation)
+        # plus a parallel list of strings for display and lookups
+        self.answers, self.answers_arr = self.load_valid_words(answer_path)
+        if guess_path:
+            self.allowed, self.allowed_arr = self.load_valid_words(guess_path)
+        else:
+            self.allowed, self.allowed_arr = self.answers.copy(), self.answers_arr.copy()
+
         # Print loading statistics
         print(f"Loaded {len(self.answers)} answer words")
         print(f"Loaded {len(self.allowed)} allowed guesses")
-        
+
+        self._answer_row = {w: i for i, w in enumerate(self.answers)}
+        self._guess_row = {w: i for i, w in enumerate(self.allowed)}
+
+        # SWAR companions: each word packed into one uint64 plus a 26-bit
+        # letter-presence mask, consumed by the packed pattern kernel
+        self.answers_u64 = _pack_u64(self.answers_arr)
+        self.allowed_u64 = _pack_u64(self.allowed_arr)
+        self.answers_letters = _letter_masks(self.answers_arr)
+        self.allowed_letters = _letter_masks(self.allowed_arr)
+
+        # Dense guess x answer pattern matrix: every (guess, target) pattern
+        # precomputed once as a base-3 uint8 code, reused for the whole session
+        self.pattern_matrix = self.load_pattern_matrix()
+
+        # Intern every word to an integer id so the pattern cache is a flat
+        # uint8 array indexed by (guess_id, answer_id) instead of a dict
+        # keyed on string tuples (255 = not computed yet, codes are < 243)
+        all_words = list(dict.fromkeys(self.allowed + self.answers))
+        self._word_id = {w: i for i, w in enumerate(all_words)}
+        self._pat = np.full((len(all_words), len(self.answers)), 255, np.uint8)
+
         # Initialize 16 independent game states
-        self.games = [{
-            'possible': self.answers.copy(),  # Possible solutions for each game
-            'correct': ['?'] * 5,  # Known correct positions
-            'present': set(),  # Present letters (wrong position)
-            'absent': set()  # Excluded letters
-        } for _ in range(16)]  # Create 16 copies for 16 simultaneous games
+        self.games = [Game(len(self.answers)) for _ in range(16)]
 
     def load_valid_words(self, file_path):
-        # Load and validate 5-letter words from file
+        # Load and validate 5-letter words from file in one bytes pass,
+        # returning both the display strings and the (N, 5) uint8 matrix
         try:
-            with open(file_path, 'r') as f:
-                words = [word.strip().upper() for word in f if len(word.strip()) == 5]
-                if not words:
-                    print(f"Error: No valid 5-letter words found in '{file_path}'!")
-                    exit(1)
-                return words
+            with open(file_path, 'rb') as f:
+                raw = [w for w in f.read().upper().split() if len(w) == 5]
+            if not raw:
+                print(f"Error: No valid 5-letter words found in '{file_path}'!")
+                exit(1)
+            # .copy() makes the array writable so it matches the kernel
+            # signatures (frombuffer views are readonly)
+            arr = np.frombuffer(b''.join(raw), np.uint8).reshape(-1, 5).copy()
+            return [w.decode('ascii') for w in raw], arr
         except FileNotFoundError:
             print(f"Error: File '{file_path}' not found!")
             exit(1)
 
+    def wordlist_key(self):
+        # Fingerprint of the loaded word lists, used to key on-disk caches
+        return hashlib.md5(
+            ' '.join(self.allowed + self.answers).encode()).hexdigest()[:12]
+
+    def load_pattern_matrix(self):
+        # Build (or reload) the precomputed pattern matrix for these word lists
+        cache_path = f"pattern_matrix_{self.wordlist_key()}.npy"
+        if os.path.exists(cache_path):
+            return np.load(cache_path)
+
+        print("Building pattern matrix (one-time cost)...")
+        matrix = _build_pattern_matrix(
+            self.allowed_arr, self.answers_arr, self.allowed_u64,
+            self.answers_u64, self.allowed_letters, self.answers_letters)
+        np.save(cache_path, matrix)
+        return matrix
+
     # Pattern calculation methods identical to Wordle solver
     @staticmethod
     def get_pattern(guess, target):
+        # Pure-Python fallback for the JIT kernels above
         # Calculate Wordle feedback pattern (C=Correct, P=Present, A=Absent)
         pattern = [''] * 5
         counts = defaultdict(int)
@@ -63,57 +269,137 @@ class SedecordleSolver:
         
         return tuple(pattern)
 
+    def get_pattern_cached(self, guess, target):
+        # Memoized version of get_pattern for performance: a single array
+        # load per hit, no tuple allocation or string hashing
+        gi = self._word_id[guess]
+        ti = self._answer_row[target]
+        code = self._pat[gi, ti]
+        if code == 255:
+            # .copy() makes the buffers writable so they match the kernel
+            # signature (frombuffer views are readonly)
+            code = _pattern_code(
+                np.frombuffer(guess.encode('ascii'), np.uint8).copy(),
+                np.frombuffer(target.encode('ascii'), np.uint8).copy())
+            self._pat[gi, ti] = code
+        # Decode the base-3 code back to the (C/P/A) tuple form
+        pattern = []
+        for _ in range(5):
+            pattern.append('APC'[code % 3])
+            code //= 3
+        return tuple(pattern)
+
     @staticmethod
-    def get_pattern_cached(guess, target):
-        # Memoized version of get_pattern for performance
-        key = (guess, target)
-        if key not in SedecordleSolver._pattern_cache:
-            SedecordleSolver._pattern_cache[key] = SedecordleSolver.get_pattern(guess, target)
-        return SedecordleSolver._pattern_cache[key]
+    def get_pattern_codes(guess_arr, pool_arr):
+        # Score one guess against a (P, 5) uint8 pool via the JIT kernel,
+        # returning a base-3 pattern code per row
+        out = np.empty(pool_arr.shape[0], np.uint8)
+        _pattern_row(guess_arr, pool_arr, out)
+        return out
 
     def calculate_entropy(self, word, game_states):
         # Calculate combined entropy across all active games
-        total_entropy = 0
+        total_entropy = 0.0
+        word_row = self.pattern_matrix[self._guess_row[word]]
         for state in game_states:
-            if not state['possible']:
+            pool_idx = state.possible_idx
+            if pool_idx.size == 0:
                 continue  # Skip solved games
-                
-            pattern_counts = defaultdict(int)
-            # Count patterns for all possible answers in this game
-            for possible in state['possible']:
-                pattern = self.get_pattern_cached(word, possible)
-                pattern_counts[pattern] += 1
-            
+
+            # Gather precomputed codes for this pool and bucket the 243 patterns
+            pattern_counts = np.bincount(word_row[pool_idx], minlength=243)
+            pattern_counts = pattern_counts[pattern_counts > 0]
+
             # Calculate entropy for this game and add to total
-            total = len(state['possible'])
-            entropy = sum(-(count/total) * math.log2(count/total) 
-                        for count in pattern_counts.values())
-            total_entropy += entropy
-        
+            probs = pattern_counts / pool_idx.size
+            total_entropy += float(-(probs * np.log2(probs)).sum())
+
         return total_entropy
 
+    def score_all_candidates(self, game_states, n_candidates):
+        # Score every candidate against every active game with the parallel
+        # JIT kernel; pools are packed CSR-style into one flat index array.
+        # Games often share identical pools (all 16 on attempt 1), so score
+        # each distinct pool once and weight it by how many games hold it
+        groups = {}
+        for state in game_states:
+            pool_idx = state.possible_idx
+            key = pool_idx.tobytes()  # Pools stay sorted, so bytes are canonical
+            if key in groups:
+                groups[key][1] += 1
+            else:
+                groups[key] = [pool_idx, 1]
+
+        # Largest pools go first so the branch-and-bound check can reject a
+        # weak candidate before touching the cheap tail games
+        pools, weights = zip(*sorted(groups.values(),
+                                     key=lambda g: g[0].size, reverse=True))
+        pool_weights = np.array(weights, np.float32)
+        pool_offsets = np.zeros(len(pools) + 1, np.int64)
+        pool_offsets[1:] = np.cumsum([p.size for p in pools])
+        pools_flat = (np.concatenate(pools) if pools
+                      else np.empty(0, np.int32)).astype(np.int32)
+
+        # remaining_ub[g] = max entropy attainable from games g..end
+        ubs = pool_weights * np.array(
+            [math.log2(p.size) if p.size else 0.0 for p in pools])
+        remaining_ub = np.zeros(len(pools) + 1, np.float32)
+        remaining_ub[:-1] = np.cumsum(ubs[::-1])[::-1]
+
+        # log2 lookup for every count the kernel can see (log2_table[0] unused)
+        max_pool = max((p.size for p in pools), default=0)
+        log2_table = np.zeros(max_pool + 1, np.float32)
+        log2_table[1:] = np.log2(np.arange(1, max_pool + 1))
+
+        # Chunked scan: the best score from finished chunks feeds the bound
+        # for later ones (a periodic reduction instead of cross-thread atomics)
+        # float32 scores: candidate ranking survives the precision loss since
+        # nearby candidates differ by far more than the ~1e-5-bit rounding
+        scores = np.empty(n_candidates, np.float32)
+        best_so_far = 0.0
+        chunk = 256
+        for start in range(0, n_candidates, chunk):
+            end = min(start + chunk, n_candidates)
+            _score_candidates(self.pattern_matrix[start:end], pools_flat,
+                              pool_offsets, pool_weights, remaining_ub,
+                              log2_table, best_so_far, scores[start:end])
+            best_so_far = max(best_so_far, scores[start:end].max())
+        return scores
+
     def get_best_guess(self):
         # Find optimal guess that maximizes information across all active games
-        active_games = [g for g in self.games if g['possible']]
+        active_games = [g for g in self.games if g.possible_idx.size]
         if not active_games:
             return None  # All games solved
-        
-        best_word = None
-        best_score = -float('inf')
-        
+
         # Optimization: Limit candidate words for initial guesses
-        print("\nCalculating best initial guess...")
-        candidates = self.allowed[:2316]  # Standard Wordle answer list size
-        
-        # Analyze candidates with progress visualization
-        for word in tqdm(candidates, desc="Analyzing words"):
-            score = self.calculate_entropy(word, active_games)
-            if score > best_score:
-                best_score = score
-                best_word = word
-                tqdm.write(f"Current best: {word} ({score:.2f})")  # Live updates
-        
-        return best_word
+        print("\nCalculating best guess...")
+        n_candidates = min(len(self.allowed), 2316)  # Standard Wordle answer list size
+
+        # The opening guess is deterministic for a given word list, so the
+        # first attempt (all pools still full) is served from an on-disk cache
+        fresh = all(g.possible_idx.size == len(self.answers)
+                    for g in self.games)
+        opener_path = f"opener_{self.wordlist_key()}.txt"
+        if fresh and os.path.exists(opener_path):
+            with open(opener_path) as f:
+                best_word, score = f.readline().split()
+            print(f"Best: {best_word} ({float(score):.2f}, cached opener)")
+            return best_word
+
+        # Score all candidates at once and take the argmax
+        scores = self.score_all_candidates(active_games, n_candidates)
+        best_idx = int(np.argmax(scores))
+
+        if fresh:
+            # Persist the top-10 openers so later sessions (and a future
+            # short-list pass on attempt 2) skip the full first-attempt scan
+            with open(opener_path, 'w') as f:
+                for i in np.argsort(scores)[::-1][:10]:
+                    f.write(f"{self.allowed[i]} {scores[i]:.6f}\n")
+
+        print(f"Best: {self.allowed[best_idx]} ({scores[best_idx]:.2f})")
+        return self.allowed[best_idx]
 
     def update_games(self, guess, feedbacks):
         # Update all games based on their individual feedback
@@ -122,67 +408,47 @@ class SedecordleSolver:
                 continue  # No feedback for this game
                 
             game = self.games[game_idx]
-            new_possible = []
-            
-            # Update game state from feedback
+
+            # Update game state from feedback, mirroring sets into bitmasks
             for i, (letter, color) in enumerate(feedback):
+                bit = 1 << (ord(letter) - 65)
                 if color == 'C':
-                    game['correct'][i] = letter
-                    if letter in game['present']:
-                        game['present'].remove(letter)
+                    game.correct[i] = ord(letter) - 65
+                    if letter in game.present:
+                        game.present.remove(letter)
+                    game.present_mask &= ~bit
                 elif color == 'P':
-                    game['present'].add(letter)
+                    game.present.add(letter)
+                    game.present_mask |= bit
                 elif color == 'A':
-                    game['absent'].add(letter)
-            
-            # Filter possible words using updated constraints
-            for word in game['possible']:
-                valid = True
-                
-                # Check correct positions
-                for i, c in enumerate(game['correct']):
-                    if c != '?' and word[i] != c:
-                        valid = False
-                        break
-                
-                # Check required present letters
-                if valid and any(p not in word for p in game['present']):
-                    valid = False
-                
-                # Check excluded letters
-                if valid and any(a in word for a in game['absent'] 
-                               if a not in game['correct'] and a not in game['present']):
-                    valid = False
-                
-                # Prevent present letters in known incorrect positions
-                if valid:
-                    for i, letter in enumerate(word):
-                        if letter in game['present'] and letter == game['correct'][i]:
-                            valid = False
-                            break
-                
-                if valid:
-                    new_possible.append(word)
-            
-            game['possible'] = new_possible
+                    game.absent.add(letter)
+                    game.absent_mask |= bit
+
+            # Filter directly from the pattern matrix: keep exactly the
+            # answers that would have produced this feedback for this guess.
+            # The correct/present/absent bookkeeping above is display-only.
+            code = sum({'C': 2, 'P': 1, 'A': 0}[color] * 3 ** i
+                       for i, (_, color) in enumerate(feedback))
+            pool = game.possible_idx
+            word_row = self.pattern_matrix[self._guess_row[guess]]
+            game.possible_idx = pool[word_row[pool] == code]
 
     def clean_constraints(self):
-        # Remove redundant constraints across all games
-        for game in self.games:
-            game['present'] = {p for p in game['present'] if p not in game['correct']}
-            game['absent'] = {a for a in game['absent'] 
-                            if a not in game['correct'] and a not in game['present']}
+        # No-op since pools are filtered straight from the pattern matrix;
+        # the constraint sets are display-only and never re-checked
+        pass
 
     def print_status(self):
         # Display status for all active games
         print("\nCurrent Game Status:")
         active_count = 0
         for i, game in enumerate(self.games):
-            if game['possible']:
+            pool = game.possible_idx
+            if pool.size:
                 active_count += 1
-                status = f"Game {i+1:2}: {len(game['possible']):4} possible"
-                if len(game['possible']) <= 3:
-                    status += f" ({', '.join(game['possible'])})"
+                status = f"Game {i+1:2}: {pool.size:4} possible"
+                if pool.size <= 3:
+                    status += f" ({', '.join(self.answers[j] for j in pool)})"
                 print(status)
         print(f"Remaining games: {active_count}/16")
 
@@ -234,7 +500,8 @@ def main():
         print("Enter this word in ALL active games, then provide feedback:")
         
         # Collect feedback for active games
-        active_games = [i for i, g in enumerate(solver.games) if g['possible']]
+        active_games = [i for i, g in enumerate(solver.games)
+                        if g.possible_idx.size]
         all_feedbacks = [[] for _ in range(16)]
         
         if active_games:
@@ -243,8 +510,8 @@ def main():
                 feedback = get_feedback_input(best_guess, game_idx+1, len(active_games), idx)
                 
                 if feedback is None:
-                    # Mark game as solved by clearing possible words
-                    solver.games[game_idx]['possible'] = []
+                    # Mark game as solved by clearing its pool
+                    solver.games[game_idx].possible_idx = np.empty(0, dtype=np.int32)
                 else:
                     all_feedbacks[game_idx] = feedback
         
@@ -252,7 +519,7 @@ def main():
         solver.update_games(best_guess, all_feedbacks)
         solver.clean_constraints()
         
-        if all(not game['possible'] for game in solver.games):
+        if all(not game.possible_idx.size for game in solver.games):
             print("\nCONGRATULATIONS! ALL GAMES SOLVED!")
             break
 